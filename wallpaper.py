@@ -6,37 +6,246 @@
 # Description: Downloads the Bing Wallpaper and sets it as wallpaper (Linux / Windows / Mac).
 
 # import requests
-from urllib.request import urlopen, urlretrieve
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from http.client import HTTPConnection, HTTPSConnection, HTTPException, HTTPResponse
+from urllib.parse import urljoin, urlsplit
 from pathlib import Path, PurePath
 import logging
 import json
-from typing import Optional, Tuple, Union
+import os
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 import subprocess
 import platform
 import argparse
+import ctypes
+import functools
+import gzip
+import re
+import threading
+import time
+
+
+# Keep-alive connections, keyed by (scheme, host), reused across the metadata and image fetches
+# so a run pays for the TLS handshake once per host instead of once per request.
+_pool: Dict[Tuple[str, str], List[HTTPConnection]] = {}
+_poolLock = threading.Lock()
+_POOL_MAXSIZE = 8
+_RETRIES = 3
+_BACKOFF_FACTOR = 0.3
+_MAX_REDIRECTS = 5
+_TIMEOUT = 30
+_CHUNK_SIZE = 1 << 20
+_BING_DAY = timedelta(hours=24)
+_JPEG_SUFFIXES = (".jpg", ".jpeg")
+_JPEG_SOI = b"\xff\xd8"
+_JPEG_EOI = b"\xff\xd9"
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+_METADATA_CACHE = Path('images') / ".bing_meta.json"
+# compact encoder shared by every json file written to `images` directory
+_JSON_ENC = json.JSONEncoder(separators=(',', ':'), sort_keys=True, ensure_ascii=False).encode
+# detected once at import, platform specific libraries are only imported in their own branch.
+_PLATFORM = platform.system()
+_user32 = ctypes.windll.user32 if _PLATFORM == "Windows" else None
+
+
+def _acquireConnection(key: Tuple[str, str]) -> HTTPConnection:
+    with _poolLock:
+        idle = _pool.get(key)
+        if idle:
+            return idle.pop()
+    scheme, host = key
+    connectionClass = HTTPSConnection if scheme == "https" else HTTPConnection
+    return connectionClass(host, timeout=_TIMEOUT)
+
+
+def _releaseConnection(key: Tuple[str, str], conn: HTTPConnection) -> None:
+    with _poolLock:
+        idle = _pool.setdefault(key, [])
+        if len(idle) < _POOL_MAXSIZE:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+@contextmanager
+def _httpGet(url: str, headers: Optional[dict] = None) -> Iterator[HTTPResponse]:
+    """GET `url` over a pooled keep-alive connection, following redirects.
+
+    Args:
+        url (str): URL to fetch.
+        headers (Optional[dict], optional): Extra request headers. Defaults to None.
+
+    Yields:
+        HTTPResponse: Response of the final (non-redirect) request.
+            The connection returns to the pool if the body was fully read.
+    """
+    for _ in range(_MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        target = parts.path or "/"
+        if parts.query:
+            target += f"?{parts.query}"
+
+        for attempt in range(_RETRIES + 1):
+            conn = _acquireConnection(key)
+            try:
+                conn.request("GET", target, headers=headers or {})
+                res = conn.getresponse()
+                break
+            except (HTTPException, OSError):
+                # most likely an idle connection the server has already dropped
+                conn.close()
+                if attempt == _RETRIES:
+                    raise
+                time.sleep(_BACKOFF_FACTOR * (2 ** attempt))
+
+        if res.status in _REDIRECT_CODES and res.getheader("Location"):
+            res.read()
+            _releaseConnection(key, conn)
+            url = urljoin(url, res.getheader("Location"))
+            continue
+
+        try:
+            yield res
+        finally:
+            if res.isclosed() and not res.will_close:
+                _releaseConnection(key, conn)
+            else:
+                conn.close()
+        return
+
+    raise HTTPException(f"Too many redirects fetching {url}")
 
 
 def getPlatform() -> str:
     """Get current platform and returns platform in string
 
     Returns:
-        str: platform string (eg. 'Windows', 'Linux', 'macOS', etc)
+        str: platform string (eg. 'Windows', 'Linux', 'Darwin', etc)
     """
-    return platform.system()
+    return _PLATFORM
 
 
-def getBingMetadata(width: int, height: int) -> json:
+def _loadMetadataCache(url: str) -> Optional[dict]:
+    """Load the metadata cached on disk for `url`.
+
+    Returns:
+        Optional[dict]: Cache entry with `url`, `etag`, `lastModified` and `metadata` keys,
+            or None when there is no usable cache for `url`.
+    """
+    try:
+        with open(_METADATA_CACHE, "r", encoding="utf-8") as fp:
+            cache = json.load(fp)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get('url') != url or 'metadata' not in cache:
+        return None
+    return cache
+
+
+def _storeMetadataCache(url: str, res: HTTPResponse, metadata: dict) -> None:
+    cache = {
+        'url': url,
+        'etag': res.getheader("ETag"),
+        'lastModified': res.getheader("Last-Modified") or res.getheader("Date"),
+        'metadata': metadata,
+    }
+    try:
+        _METADATA_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        _writeTextAtomic(_METADATA_CACHE, _JSON_ENC(cache))
+    except OSError:
+        logging.warning(f"Unable to write metadata cache {_METADATA_CACHE}")
+
+
+@functools.lru_cache(maxsize=4)
+def _getBingMetadata(width: int, height: int, day: date) -> dict:
+    # `day` is only part of the lru_cache key, so a long running process refreshes daily.
     url = f"https://go.microsoft.com/fwlink/?linkid=2151983&screenWidth={str(width)}&screenHeight={str(height)}&env=live"
+    cache = _loadMetadataCache(url)
+    headers = {'Accept-Encoding': "gzip"}
+    if cache is not None:
+        if cache.get('etag'):
+            headers['If-None-Match'] = cache['etag']
+        if cache.get('lastModified'):
+            headers['If-Modified-Since'] = cache['lastModified']
     try:
-        with urlopen(url) as res:
-            response = json.loads(res.read().decode())
+        with _httpGet(url, headers) as res:
+            if res.status == 304 and cache is not None:
+                res.read()
+                logging.debug(f"Metadata not modified, using {_METADATA_CACHE}")
+                return cache['metadata']
+            if res.status != 200:
+                raise HTTPException(f"{url} returned HTTP {res.status}")
+            body = res.read()
+            if res.getheader("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            response = json.loads(body.decode())
+        _storeMetadataCache(url, res, response)
         return response
     except Exception as e:
         logging.exception(e)
         raise e
 
 
+def getBingMetadata(width: int, height: int) -> json:
+    """Get Bing wallpaper metadata for the given screen size.
+
+    Metadata is kept in memory for the day and revalidated against the copy cached
+    in `images` directory with ETag / If-Modified-Since, so an unchanged feed isn't downloaded again.
+
+    Args:
+        width (int): screen width
+        height (int): screen height
+
+    Returns:
+        json: Bing metadata, with `images` ordered recent date first.
+    """
+    return _getBingMetadata(width, height, date.today())
+
+
+_FALLBACK_SIZE = (1920, 1080)
+_XRANDR_RE = re.compile(r"current\s+(\d+)\s*x\s*(\d+)")
+
+
+def _fallbackResolution() -> Tuple[int, int]:
+    # Failover
+    logging.warning(
+        f"Failed to detect OS and Screen resolution. Falling back to {_FALLBACK_SIZE}")
+    return _FALLBACK_SIZE
+
+
+@functools.lru_cache(maxsize=1)
+def _getGdkScreen():
+    """Import Gdk and get the default screen, once per process.
+
+    Returns:
+        Gdk.Screen: default screen, None if there is no display.
+    """
+    from gi.repository import Gdk
+    Gdk.init_check([])
+    return Gdk.Screen.get_default()
+
+
+def _setProcessDpiAware() -> None:
+    """Opt in to DPI awareness, so Windows reports physical panel pixels instead of scaled ones on HiDPI.
+
+    This is process wide and can't be undone, so it's only called from the command line entry point.
+    """
+    try:  # Windows 8.1+
+        ctypes.windll.shcore.SetProcessDpiAwareness(2)  # PROCESS_PER_MONITOR_DPI_AWARE
+        return
+    except (AttributeError, OSError):
+        pass
+    try:  # Windows Vista+
+        _user32.SetProcessDPIAware()
+    except (AttributeError, OSError):
+        logging.warning("Unable to enable DPI awareness, screen resolution may be scaled")
+
+
 # I grabbed and modified a bit from code here: https://stackoverflow.com/a/21213145
+@functools.lru_cache(maxsize=1)
 def getResolution() -> Tuple[int, int]:
     """Detect OS and screen resolution.
 
@@ -46,19 +255,11 @@ def getResolution() -> Tuple[int, int]:
             In case all fails, it returns default value: (1920, 1080)
     """
 
-    currentPlatform = getPlatform()
-    fallBackSize = (1920, 1080)
-
-    def _fallback():
-        # Failover
-        logging.warning(
-            f"Failed to detect OS and Screen resolution. Falling back to {fallBackSize}")
-        return fallBackSize
+    currentPlatform = _PLATFORM
 
     if currentPlatform == "Linux":
         try:  # Platforms supported by GTK3, Fx Linux/BSD
-            from gi.repository import Gdk
-            screen = Gdk.Screen.get_default()
+            screen = _getGdkScreen()
             width = screen.get_width()
             height = screen.get_height()
             return (width, height)
@@ -72,167 +273,349 @@ def getResolution() -> Tuple[int, int]:
             except:
                 try:  # Linux/Unix
                     args = ["xrandr", "-q", "-d", ":0"]
-                    proc = subprocess.Popen(args, stdout=subprocess.PIPE)
-                    for line in iter(proc.stdout.readline, ''):
-                        if isinstance(line, bytes):
-                            line = line.decode("utf-8")
-                        if "Screen" in line:
-                            width = int(line.split()[7])
-                            height = int(line.split()[9][:-1])
-                            return (width, height)
+                    out = subprocess.run(
+                        args, capture_output=True, text=True, timeout=2).stdout
+                    # eg. "Screen 0: minimum 8 x 8, current 1920 x 1080, maximum 32767 x 32767"
+                    match = _XRANDR_RE.search(out)
+                    return (int(match.group(1)), int(match.group(2)))
                 except:
-                    _fallback()
+                    return _fallbackResolution()
 
     elif currentPlatform == "Windows":
         try:  # Windows only
-            from win32api import GetSystemMetrics
-            width = GetSystemMetrics(0)
-            height = GetSystemMetrics(1)
+            try:  # Windows 10 1607+
+                dpi = _user32.GetDpiForSystem()
+                width = _user32.GetSystemMetricsForDpi(0, dpi)
+                height = _user32.GetSystemMetricsForDpi(1, dpi)
+            except AttributeError:
+                width = _user32.GetSystemMetrics(0)
+                height = _user32.GetSystemMetrics(1)
             return (width, height)
-
         except:
-            try:  # Windows only
-                import ctypes
-                user32 = ctypes.windll.user32
-                width = user32.GetSystemMetrics(0)
-                height = user32.GetSystemMetrics(1)
-                return (width, height)
-            except:
-                _fallback()
+            return _fallbackResolution()
 
-    elif currentPlatform == "macOS":
+    elif currentPlatform == "Darwin":
         try:  # Mac OS X only
             import AppKit
-            for screen in AppKit.NSScreen.screens():
-                width = screen.frame().size.width
-                height = screen.frame().size.height
-                return (width, height)
+            screen = AppKit.NSScreen.mainScreen()
+            if screen is None:  # no display attached
+                return _fallbackResolution()
+            # frame is in points, scale it to pixels for Retina screens
+            scale = screen.backingScaleFactor()
+            size = screen.frame().size
+            return (int(size.width * scale), int(size.height * scale))
         except:
-            _fallback()
+            return _fallbackResolution()
 
-    else:
-        _fallback()
+    return _fallbackResolution()
 
 
-def downloadWallpaper(nDaysAgo: Optional[int] = 0, overwrite: Optional[bool] = False) -> Union[Path, dict]:
-    """Download wallpaper
+def _partPath(filePath: Path) -> Path:
+    return filePath.with_suffix(filePath.suffix + ".part")
+
+
+def _writeTextAtomic(filePath: Path, text: str) -> None:
+    """Write `text` to `filePath` through a temporary file, so readers never see a partial file.
 
     Args:
-        nDaysAgo (Optional[int], optional): Get `nDaysAgo` wallpaper. Defaults to 0(today). Defaults to 0.
-        overwrite (Optional[bool], optional): Downloads any if set to True. Defaults to False.
+        filePath (Path): Destination file.
+        text (str): utf-8 text to write.
+    """
+    tmpPath = _partPath(filePath)
+    try:
+        with open(tmpPath, "w", encoding="utf-8") as fp:
+            fp.write(text)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmpPath, filePath)
+    except BaseException:
+        tmpPath.unlink(missing_ok=True)
+        raise
 
-    Returns:
-        Path: Pathlib object specifies path of image file.
-        dict: Metadata related to image file.
+
+def _downloadFile(url: str, filePath: Path) -> None:
+    """Stream `url` into `filePath` over the shared connection pool.
+
+    The body goes to a `.part` file first and is renamed over `filePath` once complete,
+    so an interrupted download never leaves a truncated file behind.
+
+    Args:
+        url (str): URL to fetch.
+        filePath (Path): Destination file.
     """
-    width, height = getResolution()
-    metadata = getBingMetadata(width, height)
+    tmpPath = _partPath(filePath)
+    with _httpGet(url) as res:
+        if res.status != 200:
+            raise HTTPException(f"{url} returned HTTP {res.status}")
+        contentLength = int(res.getheader("Content-Length") or 0)
+        fd = os.open(tmpPath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            try:
+                if contentLength:
+                    try:  # reserve contiguous extents up front, Linux/Unix only
+                        os.posix_fallocate(fd, 0, contentLength)
+                    except (AttributeError, OSError):
+                        pass
+                written = 0
+                head = tail = b""
+                while chunk := res.read(_CHUNK_SIZE):
+                    written += os.write(fd, chunk)
+                    if len(head) < 2:
+                        head = (head + chunk)[:2]
+                    tail = (tail + chunk)[-2:]
+                if contentLength and written != contentLength:
+                    raise HTTPException(
+                        f"{url} ended after {written} of {contentLength} bytes")
+                # cheap integrity check instead of decoding: JPEG starts with SOI and ends with EOI marker
+                if filePath.suffix.lower() in _JPEG_SUFFIXES and (head != _JPEG_SOI or tail != _JPEG_EOI):
+                    raise ValueError(f"{url} is not a complete JPEG image")
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmpPath, filePath)
+        except BaseException:
+            tmpPath.unlink(missing_ok=True)
+            raise
 
-    # metadata is ordered recent date first.
 
-    if nDaysAgo > len(metadata['images']):
-        nDaysAgo = len(metadata['images'])
-    idx = nDaysAgo
+def _saveWallpaper(target: dict, overwrite: Optional[bool] = False) -> Path:
+    """Download image and metadata of a single `target` entry into `images` directory.
 
-    target = metadata['images'][idx]
+    Args:
+        target (dict): An entry of `images` list from Bing metadata.
+        overwrite (Optional[bool], optional): Downloads any if set to True. Defaults to False.
+
+    Returns:
+        Path: Pathlib object specifies path of image file.
+    """
     filename = PurePath(target['url']).name
     logging.info(f"{filename}: {target}")
 
-    # create images directory
-    Path('images').mkdir(parents=True, exist_ok=True)
-
     # check if file exists
-    imagePath = Path('./images').resolve(strict=True) / Path(filename)
+    # absolute() only joins cwd, the single stat below is the existence check.
+    imagePath = Path('images').absolute() / filename
     jsonPath = imagePath.with_suffix(".json")
-    if not imagePath.is_file() or overwrite is True:
+    if overwrite is True or not imagePath.is_file():
         # write image file
         try:
             logging.debug(
                 f"Retrieving {target['url']} and save to {imagePath}")
-            urlretrieve(target['url'], imagePath)
+            _downloadFile(target['url'], imagePath)
         except Exception as e:
             logging.exception(f"Unable to fetch {target['url']}")
             raise
 
         # write json file
-        with open(jsonPath, "w") as jfp:
-            json.dump(target, jfp)
+        _writeTextAtomic(jsonPath, _JSON_ENC(target))
 
-    return imagePath, target
+    return imagePath
 
 
-def setWallpaper(imagePath: Path) -> bool:
-    """Sets Wallpaper
+def _findLocalWallpapers(moments: List[datetime]) -> Dict[int, Tuple[Path, dict]]:
+    """Look up already downloaded wallpapers that were on display at the given moments.
+
+    Bing wallpaper of a day is shown from its `fullstartdate` (eg. 08:00 UTC, not midnight) for 24 hours,
+    so matching is done against that window rather than a calendar date.
 
     Args:
-        imagePath (Path): Path to wallpaper
+        moments (List[datetime]): timezone aware moments to look for.
 
     Returns:
-        bool: True if successful, otherwise False
+        Dict[int, Tuple[Path, dict]]: index in `moments` -> (image path, metadata) for every moment found.
     """
+    found = {}
+    for jsonPath in sorted(Path('images').glob("*.json"), reverse=True):
+        if jsonPath.name == _METADATA_CACHE.name:
+            continue
+        try:
+            with open(jsonPath, "r", encoding="utf-8") as jfp:
+                target = json.load(jfp)
+            start = datetime.strptime(target['fullstartdate'], "%Y%m%d%H%M").replace(tzinfo=timezone.utc)
+            imagePath = jsonPath.absolute().with_name(PurePath(target['url']).name)
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+        for idx, moment in enumerate(moments):
+            if idx not in found and start <= moment < start + _BING_DAY and imagePath.is_file():
+                found[idx] = (imagePath, target)
+        if len(found) == len(moments):
+            break
+    return found
+
+
+def downloadWallpaper(nDaysAgo: Optional[int] = 0, overwrite: Optional[bool] = False,
+                      backfill: Optional[bool] = False) -> Union[Path, dict]:
+    """Download wallpaper
 
-    currentPlatform = getPlatform()
-    if not imagePath.is_file():
-        logging.error(f"{imagePath} is not found")
+    Args:
+        nDaysAgo (Optional[int], optional): Get `nDaysAgo` wallpaper. Defaults to 0(today). Defaults to 0.
+        overwrite (Optional[bool], optional): Downloads any if set to True. Defaults to False.
+        backfill (Optional[bool], optional): Also downloads every wallpaper between today and `nDaysAgo`,
+            concurrently. Defaults to False.
+
+    Returns:
+        Path: Pathlib object specifies path of image file.
+        dict: Metadata related to image file.
+    """
+    if not overwrite:
+        # skip the network entirely if the wanted wallpapers are already downloaded.
+        now = datetime.now(timezone.utc)
+        moments = [now - timedelta(days=n) for n in range(nDaysAgo + 1)]
+        if not backfill:
+            moments = moments[-1:]
+        local = _findLocalWallpapers(moments)
+        if len(local) == len(moments):
+            imagePath, target = local[len(moments) - 1]
+            logging.info(f"{target.get('startdate')} wallpaper is already downloaded")
+            return imagePath, target
+
+    width, height = getResolution()
+    metadata = getBingMetadata(width, height)
+
+    # metadata is ordered recent date first.
+
+    if nDaysAgo >= len(metadata['images']):
+        nDaysAgo = len(metadata['images']) - 1
+    idx = nDaysAgo
+
+    target = metadata['images'][idx]
+    targets = metadata['images'][:idx + 1] if backfill else [target]
+
+    # create images directory
+    Path('images').mkdir(parents=True, exist_ok=True)
+
+    # downloads are network bound, so fetch them side by side over the shared connection pool
+    with ThreadPoolExecutor(max_workers=min(len(targets), _POOL_MAXSIZE)) as executor:
+        imagePaths = list(executor.map(
+            lambda t: _saveWallpaper(t, overwrite), targets))
+
+    return imagePaths[-1], target
+
+
+def _setWindows(imagePath: Path) -> bool:
+    logging.info(f"Setting {imagePath} as a wallpaper")
+    uiAction = 20  # SPI_SETDESKWALLPAPER = 0x0014 or 20 in decimal
+    uiParam = 0
+    pvParam = str(imagePath)
+    fWinIni = 0
+    success = _user32.SystemParametersInfoW(
+        uiAction, uiParam, pvParam, fWinIni)
+    if success:
+        logging.info("Wallpaper is set.")
+        return True
+    else:
+        logging.error("Setting wallpaper has failed.")
         return False
 
-    if currentPlatform == "Windows":
-        import ctypes
-        logging.info(f"Setting {imagePath} as a wallpaper")
-        uiAction = 20  # SPI_SETDESKWALLPAPER = 0x0014 or 20 in decimal
-        uiParam = 0
-        pvParam = str(imagePath)
-        fWinIni = 0
-        success = ctypes.windll.user32.SystemParametersInfoW(
-            uiAction, uiParam, pvParam, fWinIni)
-        if success:
-            logging.info("Wallpaper is set.")
-            return True
-        else:
-            logging.error("Setting wallpaper has failed.")
-            return False
 
-    elif currentPlatform == "Linux":
-        command = ["gsettings", "set", "org.gnome.desktop.background",
-                   "picture-uri", f"file://{str(imagePath)}"]
-        process = subprocess.Popen(
-            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        process.communicate()
-        if process.returncode == 0:
+def _setLinux(imagePath: Path) -> bool:
+    uri = f"file://{str(imagePath)}"
+    try:  # GSettings in process, through PyGObject
+        from gi.repository import Gio
+    except ImportError:
+        returncode = None
+        # picture-uri-dark only exists on GNOME 42+, its failure on older GNOME is ignored.
+        for key in ("picture-uri", "picture-uri-dark"):
+            command = ["gsettings", "set", "org.gnome.desktop.background",
+                       key, uri]
+            process = subprocess.Popen(
+                command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            process.communicate()
+            if returncode is None:
+                returncode = process.returncode
+        if returncode == 0:
             return True
         else:
             return False
 
-    elif currentPlatform == "macOS":
+    # GLib aborts the process on unknown schema or key, so check them first.
+    schemaId = "org.gnome.desktop.background"
+    source = Gio.SettingsSchemaSource.get_default()
+    schema = source.lookup(schemaId, True) if source is not None else None
+    if schema is None:
+        logging.error(f"GSettings schema {schemaId} is not installed")
+        return False
+    settings = Gio.Settings.new(schemaId)
+    success = settings.set_string("picture-uri", uri)
+    if schema.has_key("picture-uri-dark"):  # GNOME 42+
+        success = settings.set_string("picture-uri-dark", uri) and success
+    Gio.Settings.sync()
+    return success
+
+
+def _setMacos(imagePath: Path) -> bool:
+    try:  # PyObjC, set in process
+        from AppKit import NSScreen, NSWorkspace
+        from Foundation import NSURL
+    except ImportError:
         # might need to try if current method doesn't work
         # https://apple.stackexchange.com/a/145174
         # sqlite3 ~/Library/Application\ Support/Dock/desktoppicture.db "update data set value = '/path/to/any/picture.png'" && killall Dock
-
         command = ["osascript", "-e",
-                   "'tell application \"Finder\" to set desktop picture to POSIX file \"{imagePath}\"'"]
+                   f"tell application \"Finder\" to set desktop picture to POSIX file \"{imagePath}\""]
         process = subprocess.Popen(
             command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         process.communicate()
-        if process.returncode == 0:
-            return True
-        return False
-    else:
-        logging.error("OS Type unknown")
+        return process.returncode == 0
+
+    url = NSURL.fileURLWithPath_(str(imagePath))
+    workspace = NSWorkspace.sharedWorkspace()
+    for screen in NSScreen.screens():
+        success, error = workspace.setDesktopImageURL_forScreen_options_error_(
+            url, screen, {}, None)
+        if not success:
+            logging.error(f"Setting wallpaper has failed: {error}")
+            return False
+    return True
+
+
+def _setUnknown(imagePath: Path) -> bool:
+    logging.error("OS Type unknown")
     return False
 
 
+# platform.system() -> wallpaper setter, each setter imports its own libraries only when called.
+_SETTERS = {
+    "Windows": _setWindows,
+    "Linux": _setLinux,
+    "Darwin": _setMacos,
+}
+_setPlatformWallpaper = _SETTERS.get(_PLATFORM, _setUnknown)
+
+
+def setWallpaper(imagePath: Path) -> bool:
+    """Sets Wallpaper
+
+    Args:
+        imagePath (Path): Path to wallpaper
+
+    Returns:
+        bool: True if successful, otherwise False
+    """
+
+    if not imagePath.is_file():
+        logging.error(f"{imagePath} is not found")
+        return False
+
+    return _setPlatformWallpaper(imagePath)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument('-n', '--ndays', help="Number of previous days to retrieve.",
                         dest="nDaysAgo", default=0, type=int)
     parser.add_argument('-m', '--metadata',
                         help="output metadata to stdout.", dest="showJson", action=argparse.BooleanOptionalAction)
-
-    showJson = parser.parse_args().showJson
-    nDaysAgo = parser.parse_args().nDaysAgo
-    nDaysAgo = 7 if nDaysAgo >= 7 else nDaysAgo
-    nDaysAgo = 0 if nDaysAgo <= 0 else nDaysAgo
-    imagePath, metadata = downloadWallpaper(nDaysAgo=nDaysAgo)
+    parser.add_argument('-b', '--backfill',
+                        help="also download every wallpaper between today and `--ndays`.", dest="backfill",
+                        action=argparse.BooleanOptionalAction)
+
+    args = parser.parse_args()
+    if _PLATFORM == "Windows":
+        _setProcessDpiAware()
+    showJson = args.showJson
+    backfill = args.backfill
+    nDaysAgo = max(0, min(7, args.nDaysAgo))
+    imagePath, metadata = downloadWallpaper(nDaysAgo=nDaysAgo, backfill=backfill)
     if showJson and metadata is not None:
         print(json.dumps(metadata, indent=4, sort_keys=True))
     setWallpaper(imagePath)